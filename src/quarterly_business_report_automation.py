@@ -1,34 +1,62 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import json
+from functools import lru_cache
+import heapq
+from itertools import islice
+from operator import attrgetter
 import os
+import sys
+import threading
+import time
+from types import MappingProxyType
 
 from dotenv import load_dotenv
 from loguru import logger
 import opsgenie_sdk
 from opsgenie_sdk import ApiException as OpsgenieApiException
 from opsgenie_sdk import BaseAlert as OpsgenieBaseAlert
+import orjson
 import pysnow
 import requests
-import smartsheet
-import smartsheet.sheets
+from requests.adapters import HTTPAdapter
 from smartsheet.models.sheet import Sheet as SmartsheetSheet
 from smartsheet.models.row import Row as SmartsheetRow
-from smartsheet.models.cell import Cell as SmartsheetCell
+from smartsheet.models.error import Error as SmartsheetError
+from smartsheet.exceptions import ApiError as SmartsheetApiError
+from smartsheet.exceptions import UnexpectedRequestError as SmartsheetUnexpectedRequestError
 from smartsheet import Smartsheet as SmartsheetClient
+from urllib3.util.retry import Retry
 
 
 # ====================== Environment / Global Variables =======================
 load_dotenv(override=True)
 
+# Initialize the start of the quarterly window once, so every customer and
+# every data source in this run share the same window.
+QUARTER_START_DATE = datetime.today() - timedelta(days=90)
+
+# Initialize the most rows a Smartsheet dashboard can show. Every data source
+# stops gathering rows once it reaches this many.
+SMARTSHEET_MAX_DASHBOARD_ROW_COUNT = 2500
+
 # Initialize customer constant global variables.
-with open('/vault/secrets/qbr_auto', 'r') as file:
-    CUSTOMER_CONFIGS_FILE_JSON = json.load(file)
-CUSTOMER_CONFIGS_STRING = CUSTOMER_CONFIGS_FILE_JSON['data']['customer_configs']
-CUSTOMER_CONFIGS = json.loads(CUSTOMER_CONFIGS_STRING)
+CUSTOMER_CONFIGS_FILE_PATH = '/vault/secrets/qbr_auto'
+CUSTOMER_MAX_CONCURRENT_RUNS = 4
+# Opsgenie, ServiceNow, and PRTG data is handled at the same time for each
+# customer, and each data source sends one Smartsheet request at a time.
+CUSTOMER_DATA_SOURCE_COUNT = 3
 
 # Initialize Opsgenie constant global variables.
 OPSGENIE_API_KEY = os.getenv('OPSGENIE_API_KEY')
 OPSGENIE_MAX_RESPONSE_LIMIT = 100
+OPSGENIE_MAX_CONCURRENT_PAGES = 4
+# Opsgenie throttles per API key, so this bounds the requests in flight across
+# every customer, not just within one customer's pagination.
+OPSGENIE_MAX_CONCURRENT_REQUESTS = 8
+OPSGENIE_REQUEST_SEMAPHORE = threading.BoundedSemaphore(OPSGENIE_MAX_CONCURRENT_REQUESTS)
+OPSGENIE_QUARTER_START_DATE = QUARTER_START_DATE.strftime('%d-%m-%Y')
+OPSGENIE_SMARTSHEET_KEY_COLUMN_INDEXES = (3,)
 
 # Initialize PRTG constant global variables.
 PRTG_01_USE_DEFAULTS_KEYWORD = 'prtg_01_default_instance'
@@ -37,7 +65,34 @@ PRTG_01_DEFAULT_API_KEY = os.getenv('PRTG_01_DEFAULT_API_KEY')
 PRTG_02_USE_DEFAULTS_KEYWORD = 'prtg_02_default_instance'
 PRTG_02_DEFAULT_INSTANCE_URL = os.getenv('PRTG_02_DEFAULT_INSTANCE_URL')
 PRTG_02_DEFAULT_API_KEY = os.getenv('PRTG_02_DEFAULT_API_KEY')
+PRTG_DEFAULT_INSTANCES = {
+    PRTG_01_USE_DEFAULTS_KEYWORD: (PRTG_01_DEFAULT_INSTANCE_URL, PRTG_01_DEFAULT_API_KEY),
+    PRTG_02_USE_DEFAULTS_KEYWORD: (PRTG_02_DEFAULT_INSTANCE_URL, PRTG_02_DEFAULT_API_KEY)
+}
 PRTG_MAX_RESPONSE_LIMIT = 50000
+# The PRTG API parameters shared by every PRTG instance. They are read-only
+# since every PRTG request thread shares them. No more than
+# SMARTSHEET_MAX_DASHBOARD_ROW_COUNT sensors can ever make it into the
+# Smartsheet, so there is no need to ask any instance for more than that.
+PRTG_SENSOR_API_PARAMETERS = MappingProxyType({
+    'content': 'sensors',
+    'columns': 'name,parentid,downtimesince,status,' \
+               'probe,group,device,message',
+    'filter_status': '@neq(3)',
+    'output': 'json',
+    'count': str(min(PRTG_MAX_RESPONSE_LIMIT, SMARTSHEET_MAX_DASHBOARD_ROW_COUNT))
+})
+PRTG_MAX_CONCURRENT_INSTANCES = 8
+PRTG_SMARTSHEET_KEY_COLUMN_INDEXES = (2, 3)
+PRTG_REQUEST_TIMEOUT_SECONDS = (5, 30)
+PRTG_SESSION = requests.Session()
+PRTG_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+)
+PRTG_SESSION.mount('https://', PRTG_HTTP_ADAPTER)
+PRTG_SESSION.mount('http://', PRTG_HTTP_ADAPTER)
 
 # Initialize ServiceNow constant global variables.
 SERVICENOW_INSTANCE_NAME = os.getenv('SERVICENOW_INSTANCE_NAME')
@@ -49,21 +104,41 @@ SERVICENOW_CLIENT = pysnow.Client(
     password=SERVICENOW_PASSWORD
 )
 SERVICENOW_CLIENT.parameters.display_value = True
+SERVICENOW_CLIENT.parameters.exclude_reference_link = True
+SERVICENOW_CLIENT.parameters.suppress_pagination_header = True
 SERVICENOW_TICKET_FIELDS = [
     'number', 'location.name', 'cmdb_ci.name', 'short_description', 'state',
     'category', 'priority', 'risk', 'assigned_to.name', 'opened_at',
     'sys_updated_by', 'closed_at'
 ]
+SERVICENOW_TICKET_TABLES = ['incident', 'sc_req_item', 'change_request']
+SERVICENOW_CLIENT.session.mount('https://', HTTPAdapter(
+    pool_maxsize=len(SERVICENOW_TICKET_TABLES) * CUSTOMER_MAX_CONCURRENT_RUNS,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
 SERVICENOW_DATETIME_FORMAT = "%Y-%m-%d %I:%M:%S %p"
+SERVICENOW_SMARTSHEET_KEY_COLUMN_INDEXES = (0,)
 
 # Initialize Smartsheet constant global variables.
 SMARTSHEET_API_KEY = os.getenv('SMARTSHEET_API_KEY')
-SMARTSHEET_CLIENT = SmartsheetClient(access_token=SMARTSHEET_API_KEY)
-SMARTSHEET_MAX_DASHBOARD_ROW_COUNT = 2500
-SMARTSHEET_MAX_ROW_DELETION = 100
+SMARTSHEET_MAX_ROW_ADDITION = 500
+# Row IDs to delete are sent in the URL's query string, which keeps a
+# deletion request to about 450 IDs.
+SMARTSHEET_MAX_ROW_DELETION = 450
+SMARTSHEET_MAX_REQUEST_ATTEMPTS = 3
+SMARTSHEET_RETRY_BACKOFF_SECONDS = 2
+# Only these Smartsheet error codes (system maintenance, server timeout, rate
+# limit, and concurrent edit) and 5xx responses are worth trying again.
+SMARTSHEET_TRANSIENT_ERROR_CODES = (4001, 4002, 4003, 4004)
+SMARTSHEET_MAX_REQUESTS_PER_MINUTE = 300
 
 # Initialize other constant global variables.
 TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+LOG_FORMAT = '<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | ' \
+             '<level>{level: <8}</level> | ' \
+             '<magenta>{thread.name}</magenta> | ' \
+             '<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - ' \
+             '<level>{message}</level>'
 
 
 # ================================== Classes ==================================
@@ -81,80 +156,114 @@ class OpsgenieClient:
         # Initialize configuration of the Opsgenie SDK.
         self.conf = opsgenie_sdk.configuration.Configuration()
         self.conf.api_key['Authorization'] = OPSGENIE_API_KEY
+        self.conf.connection_pool_maxsize = OPSGENIE_MAX_CONCURRENT_REQUESTS
         self.api_client = opsgenie_sdk.api_client.ApiClient(configuration=self.conf)
 
         # Initialize needed API endpoints.
         self.alert_api = opsgenie_sdk.AlertApi(api_client=self.api_client)
 
+    def get_opsgenie_alerts_page(self, query: str, offset: int):
+        """
+        Returns a single page of Opsgenie alerts based off the provided query
+        starting at the provided offset. The page will never extend past
+        SMARTSHEET_MAX_DASHBOARD_ROW_COUNT alerts. The request waits until
+        fewer than OPSGENIE_MAX_CONCURRENT_REQUESTS Opsgenie requests are in
+        flight.
+
+        Args:
+            query (str): The query string to send to Opsgenie.
+            offset (int): The offset of the first alert in the page.
+
+        Returns:
+            ListAlertsResponse: The Opsgenie response for this page of alerts.
+        """
+
+        with OPSGENIE_REQUEST_SEMAPHORE:
+            return self.alert_api.list_alerts(
+                limit=OPSGENIE_MAX_RESPONSE_LIMIT
+                    if (offset + OPSGENIE_MAX_RESPONSE_LIMIT) <= SMARTSHEET_MAX_DASHBOARD_ROW_COUNT
+                    else (SMARTSHEET_MAX_DASHBOARD_ROW_COUNT - offset),
+                offset=offset,
+                order='desc',
+                query=query
+            )
+
     def paginate_opsgenie_alerts(self, query: str):
         """
         Generator function that will paginate over a list of Opsgenie alerts 
         based off the provided query. Returns a list of Opsgenie BaseAlert
-        objects. This generator will stop providing results as soon as it 
-        outputs SMARTSHEET_MAX_DASHBOARD_ROW_COUNT amount of alerts.
+        objects. Only the first page is requested on its own. Each full page
+        shows there is at least one more page, so up to
+        OPSGENIE_MAX_CONCURRENT_PAGES of the following pages are then requested
+        ahead of time so their network round trips overlap, but pages are
+        always yielded in order. This generator will stop providing results as
+        soon as it outputs SMARTSHEET_MAX_DASHBOARD_ROW_COUNT amount of alerts.
 
         Args:
             query (str): The query string to send to Opsgenie. More information
                 for how to format an Opsgenie query can be found here:
                 https://support.atlassian.com/opsgenie/docs/search-queries-for-alerts/
 
-        Returns:
-            list[BaseAlert]: A list of Opsgenie BaseAlert objects.
-
         Yields:
             list[BaseAlert]: A list of Opsgenie BaseAlert objects.
-        """
 
-        # Keep track of the offset from the results for pagination.
-        current_offset = 0
+        Raises:
+            OpsgenieApiException: If a page still fails after the SDK's own
+                retries.
+        """
 
-        # Get the first page of the response.
-        try:
-            list_alerts_response = self.alert_api.list_alerts(
-                limit=OPSGENIE_MAX_RESPONSE_LIMIT if OPSGENIE_MAX_RESPONSE_LIMIT <= SMARTSHEET_MAX_DASHBOARD_ROW_COUNT else SMARTSHEET_MAX_DASHBOARD_ROW_COUNT,
-                order='desc',
-                query=query
-            )
-        except OpsgenieApiException as og_api_exception:
-            logger.error("An exception occurred when calling the Opsgenie " \
-                         "AlertApi->list_alerts endpoint: %s\n" % og_api_exception)
-
-        # Check if there is not a next page.
-        if list_alerts_response.paging.next is None or len(list_alerts_response.data) == SMARTSHEET_MAX_DASHBOARD_ROW_COUNT:
-            # Return the first (and only) page of alert data.
-            return list_alerts_response.data
-        
-        # Return the first page of data.
-        yield list_alerts_response.data
-
-        # While there are more pages, keep paginating the alerts response.
-        current_offset += OPSGENIE_MAX_RESPONSE_LIMIT
-        while list_alerts_response.paging.next is not None and current_offset < SMARTSHEET_MAX_DASHBOARD_ROW_COUNT:
-            # Get the next page of the alerts response.
-            try:
-                list_alerts_response = self.alert_api.list_alerts(
-                    limit=OPSGENIE_MAX_RESPONSE_LIMIT
-                        if (current_offset + OPSGENIE_MAX_RESPONSE_LIMIT) <= SMARTSHEET_MAX_DASHBOARD_ROW_COUNT
-                        else (SMARTSHEET_MAX_DASHBOARD_ROW_COUNT - current_offset),
-                    offset=current_offset,
-                    order='desc',
-                    query=query
+        # Get the offsets of every page we could possibly need.
+        page_offsets = iter(range(0, SMARTSHEET_MAX_DASHBOARD_ROW_COUNT, OPSGENIE_MAX_RESPONSE_LIMIT))
+
+        with ThreadPoolExecutor(max_workers=OPSGENIE_MAX_CONCURRENT_PAGES) as opsgenie_executor:
+            # Request only the first page, since it is not known yet if there
+            # are any more pages.
+            page_futures = deque([opsgenie_executor.submit(self.get_opsgenie_alerts_page, query, next(page_offsets))])
+
+            # Keep yielding pages in order until there are no more pages.
+            while page_futures:
+                # Get the next page of the alerts response.
+                try:
+                    list_alerts_response = page_futures.popleft().result()
+                except OpsgenieApiException as og_api_exception:
+                    # The SDK already retried this page, so stop here rather
+                    # than syncing an incomplete list of alerts.
+                    logger.error("An exception occurred when calling the Opsgenie " \
+                                 "AlertApi->list_alerts endpoint: %s\n" % og_api_exception)
+                    raise
+
+                # Return the next page of the alerts response.
+                yield list_alerts_response.data
+
+                # Check if there is not a next page. A page that is not full
+                # is always the last one.
+                if list_alerts_response.paging.next is None \
+                        or len(list_alerts_response.data) < OPSGENIE_MAX_RESPONSE_LIMIT:
+                    break
+
+                # This page was full, so keep the window full by requesting
+                # the next unrequested pages.
+                page_futures.extend(
+                    opsgenie_executor.submit(self.get_opsgenie_alerts_page, query, page_offset)
+                    for page_offset in islice(page_offsets, OPSGENIE_MAX_CONCURRENT_PAGES - len(page_futures))
                 )
-            except OpsgenieApiException as og_api_exception:
-                logger.error("An exception occurred when calling the Opsgenie " \
-                             "AlertApi->list_alerts endpoint: %s\n" % og_api_exception)
-            
-            # Return the next page of the alerts response.
-            yield list_alerts_response.data
-            
-            # Get the offset for the next page.
-            current_offset += OPSGENIE_MAX_RESPONSE_LIMIT
+
+            # Cancel any pages that were requested ahead of time but are not
+            # needed anymore.
+            for page_future in page_futures:
+                page_future.cancel()
 
 
 class ServiceNowTicket:
     """
     Represents a ticket in ServiceNow.
     """
+
+    __slots__ = (
+        'number', 'location', 'cmdb_ci', 'short_description', 'state',
+        'category', 'priority', 'risk', 'assigned_to', 'opened_at',
+        'updated_by', 'closed_at', 'resolve_time'
+    )
     
     def __init__(self, number: str, location: str, cmdb_ci: str, short_description: str,
                  state: str, category: str, priority: str, risk: str, assigned_to: str,
@@ -192,9 +301,9 @@ class ServiceNowTicket:
         self.priority = priority
         self.risk = '' if risk is None else risk
         self.assigned_to = assigned_to
-        self.opened_at = datetime.strptime(opened_at, SERVICENOW_DATETIME_FORMAT)
+        self.opened_at = parse_servicenow_datetime(opened_at)
         self.updated_by = updated_by
-        self.closed_at = None if closed_at == '' else datetime.strptime(closed_at, SERVICENOW_DATETIME_FORMAT)
+        self.closed_at = None if closed_at == '' else parse_servicenow_datetime(closed_at)
         
         # Determine resolve time by hand.
         if self.closed_at is None:
@@ -210,6 +319,11 @@ class PRTGSensor:
     Represents a sensor from PRTG.
     """
 
+    __slots__ = (
+        'name', 'parent_id', 'downtime_since', 'status', 'probe', 'group',
+        'device', 'message'
+    )
+
     def __init__(self, name: str, parent_id: int, downtime_since: str, status: str,
                  probe: str, group: str, device: str, message: str):
         """
@@ -236,53 +350,269 @@ class PRTGSensor:
         self.message = message
 
 
+class RateLimiter:
+    """
+    Represents a thread-safe token bucket that limits how many requests are
+    sent to a service within a period of time.
+    """
+
+    def __init__(self, max_requests: int, period_seconds: float, max_burst: int = 1):
+        """
+        Initializes a token bucket that holds up to max_burst tokens and
+        starts full. The bucket refills at a rate that leaves room for that
+        burst, so no period ever holds more than max_requests requests, not
+        even the first one.
+
+        Args:
+            max_requests (int): The maximum number of requests that can be
+                sent within the period.
+            period_seconds (float): The length of the period in seconds.
+            max_burst (int): The maximum number of requests that can be sent
+                at once. Defaults to 1.
+
+        Raises:
+            ValueError: If max_burst is not lower than max_requests, since the
+                bucket could then never refill.
+        """
+
+        # Check if the burst leaves no room for the bucket to refill.
+        if max_burst >= max_requests:
+            raise ValueError(f'max_burst ({max_burst}) must be lower than '
+                             f'max_requests ({max_requests})')
+
+        self.capacity = max_burst
+        self.refill_rate = (max_requests - max_burst) / period_seconds
+        self.tokens = float(max_burst)
+        self.last_refill_time = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request can be sent without exceeding the rate limit
+        and takes a token for it.
+        """
+
+        while True:
+            with self.lock:
+                # Refill the bucket for the time that passed since the last
+                # refill.
+                current_time = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (current_time - self.last_refill_time) * self.refill_rate
+                )
+                self.last_refill_time = current_time
+
+                # Check if there is a token for this request.
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                # Work out how long until the next token is available.
+                wait_seconds = (1 - self.tokens) / self.refill_rate
+
+            time.sleep(wait_seconds)
+
+
 # ================================= Functions =================================
-def clear_smartsheet(smartsheet_sheet: SmartsheetSheet) -> None:
+def parse_servicenow_datetime(servicenow_datetime: str) -> datetime:
     """
-    Clears all rows in the provided Smartsheet.
+    Given a ServiceNow date and time in the SERVICENOW_DATETIME_FORMAT
+    format (for example "2024-01-02 03:04:05 PM"), return it as a datetime.
+    The fields are read straight from their fixed positions, which is much
+    faster than datetime.strptime. Anything not laid out exactly like that is
+    handed to datetime.strptime instead.
 
     Args:
-        smartsheet_sheet (SmartsheetSheet): The Smartsheet 
-            to clear all the rows for.
+        servicenow_datetime (str): The ServiceNow date and time.
+
+    Returns:
+        datetime: The parsed date and time.
     """
 
-    logger.info(f'Clearing Smartsheet "{smartsheet_sheet.name}"...')
+    # Check if the date and time is laid out differently than expected. The
+    # separators sit at every third character from the fifth one on, and
+    # every field between them must be plain ASCII digits, since int() would
+    # also accept signs, spaces, and non-ASCII digits that strptime rejects.
+    meridiem = servicenow_datetime[20:].upper()
+    datetime_digits = servicenow_datetime[0:4] + servicenow_datetime[5:7] \
+        + servicenow_datetime[8:10] + servicenow_datetime[11:13] \
+        + servicenow_datetime[14:16] + servicenow_datetime[17:19]
+    if len(servicenow_datetime) != 22 or meridiem not in ('AM', 'PM') \
+            or servicenow_datetime[4:20:3] != '-- :: ' \
+            or not datetime_digits.isascii() or not datetime_digits.isdigit():
+        return datetime.strptime(servicenow_datetime, SERVICENOW_DATETIME_FORMAT)
+
+    # Convert the 12-hour clock hour to a 24-hour clock hour.
+    hour = int(servicenow_datetime[11:13])
+    if not 1 <= hour <= 12:
+        return datetime.strptime(servicenow_datetime, SERVICENOW_DATETIME_FORMAT)
+    hour = hour % 12 + (12 if meridiem == 'PM' else 0)
+
+    return datetime(
+        int(servicenow_datetime[0:4]),
+        int(servicenow_datetime[5:7]),
+        int(servicenow_datetime[8:10]),
+        hour,
+        int(servicenow_datetime[14:16]),
+        int(servicenow_datetime[17:19])
+    )
 
-    # Gather all row IDs in the Smartsheet.
-    all_row_ids = []
-    for row in smartsheet_sheet.rows:
-        # Add this row's ID to the row ID list.
-        all_row_ids.append(row.id)
-    
-    # Check if the Smartsheet is already empty.
-    if len(all_row_ids) == 0:
-        logger.info('Smartsheet already empty!')
-        return
 
-    # Clear the Smartsheet in chunks.
-    for chunk_offset in range(0, len(all_row_ids), SMARTSHEET_MAX_ROW_DELETION):
-        # Get the row ID chunk.
-        row_id_chunk = all_row_ids[chunk_offset:chunk_offset + SMARTSHEET_MAX_ROW_DELETION]
+@lru_cache(maxsize=1)
+def get_smartsheet_client() -> SmartsheetClient:
+    """
+    Returns the connection to our Smartsheet account. The connection is only
+    built on the first call and is reused by every call after that. main()
+    builds it before any customer thread starts, so only one connection is
+    ever built.
+
+    Returns:
+        SmartsheetClient: The connection to our Smartsheet account.
+    """
+
+    return SmartsheetClient(
+        access_token=SMARTSHEET_API_KEY,
+        max_connections=CUSTOMER_DATA_SOURCE_COUNT * CUSTOMER_MAX_CONCURRENT_RUNS
+    )
+
+
+@lru_cache(maxsize=1)
+def get_smartsheet_rate_limiter() -> RateLimiter:
+    """
+    Returns the rate limiter shared by every Smartsheet request in this run,
+    so all customers together stay within SMARTSHEET_MAX_REQUESTS_PER_MINUTE.
+    main() builds it before any customer thread starts, so only one rate
+    limiter is ever created.
+
+    Returns:
+        RateLimiter: The Smartsheet rate limiter.
+    """
+
+    return RateLimiter(SMARTSHEET_MAX_REQUESTS_PER_MINUTE, 60)
 
-        # Clear this chunk of rows in the Smartsheet.
-        clear_row_chunk_response = SMARTSHEET_CLIENT.Sheets.delete_rows(
-            smartsheet_sheet.id,
-            row_id_chunk
-        )
 
-        # Check if the clearing failed and try again.
-        if clear_row_chunk_response.message != 'SUCCESS':
-            logger.error(f'An error occurred while trying to clear a chunk of '
-                         f'rows from the "{smartsheet_sheet.name}" Smartsheet')
-            logger.error(f'Result Code: {clear_row_chunk_response.result.code}')
+def send_smartsheet_request(smartsheet_request, *request_args, **request_kwargs):
+    """
+    Sends the provided Smartsheet SDK request with the provided arguments
+    once the Smartsheet rate limit allows it. If the request fails with a
+    transient error or never gets a response, it is tried again with an
+    exponential backoff up to SMARTSHEET_MAX_REQUEST_ATTEMPTS times. Any other
+    error is returned right away, since trying again would fail the same way.
+
+    Args:
+        smartsheet_request: The Smartsheet SDK method to call.
+        *request_args: The positional arguments to call the Smartsheet SDK
+            method with.
+        **request_kwargs: The keyword arguments to call the Smartsheet SDK
+            method with.
+
+    Returns:
+        The Smartsheet response of the last attempt. This is a SmartsheetError
+            if the request failed.
+
+    Raises:
+        SmartsheetUnexpectedRequestError: If the last attempt never got a
+            response from Smartsheet.
+    """
+
+    for attempt_number in range(1, SMARTSHEET_MAX_REQUEST_ATTEMPTS + 1):
+        # Wait for the rate limit, then send the request to Smartsheet.
+        get_smartsheet_rate_limiter().acquire()
+        try:
+            smartsheet_response = smartsheet_request(*request_args, **request_kwargs)
+        except SmartsheetUnexpectedRequestError as request_exception:
+            # The request never got a response from Smartsheet (connection
+            # reset, timeout, etc.), so give up only on the last attempt.
+            if attempt_number == SMARTSHEET_MAX_REQUEST_ATTEMPTS:
+                raise
+
+            logger.error(f'Smartsheet request failed on attempt {attempt_number} '
+                         f'of {SMARTSHEET_MAX_REQUEST_ATTEMPTS}: {request_exception}')
+        else:
+            # Check if the request succeeded.
+            if not isinstance(smartsheet_response, SmartsheetError):
+                break
+
+            logger.error(f'Smartsheet request failed on attempt {attempt_number} '
+                         f'of {SMARTSHEET_MAX_REQUEST_ATTEMPTS}')
+            logger.error(f'Result Code: {smartsheet_response.result.code}')
+
+            # Check if the error is not transient, such as a bad request or a
+            # missing Smartsheet.
+            if smartsheet_response.result.code not in SMARTSHEET_TRANSIENT_ERROR_CODES \
+                    and (smartsheet_response.result.status_code or 0) < 500:
+                break
+
+        # Check if we should try again.
+        if attempt_number < SMARTSHEET_MAX_REQUEST_ATTEMPTS:
             logger.info('Trying again...')
-            continue
+            time.sleep(SMARTSHEET_RETRY_BACKOFF_SECONDS * 2 ** (attempt_number - 1))
 
-    logger.info(f'All rows in the "{smartsheet_sheet.name}" Smartsheet were '
-                f'cleared successfully!')
-    
+    return smartsheet_response
+
+
+def delete_smartsheet_row_chunk(smartsheet_sheet: SmartsheetSheet, row_id_chunk: list[int]) -> bool:
+    """
+    Deletes the provided chunk of row IDs from the provided Smartsheet.
+
+    Args:
+        smartsheet_sheet (SmartsheetSheet): The Smartsheet to delete the rows
+            in.
+        row_id_chunk (list[int]): The IDs of the rows to delete. There must be
+            no more than SMARTSHEET_MAX_ROW_DELETION IDs in the chunk.
 
-def delete_smartsheet_rows(smartsheet_sheet: SmartsheetSheet, smartsheet_rows: list[SmartsheetRow]) -> None:
+    Returns:
+        bool: True if the chunk of rows was deleted, False otherwise.
+    """
+
+    # Delete this chunk of rows in the Smartsheet.
+    delete_row_chunk_response = send_smartsheet_request(
+        get_smartsheet_client().Sheets.delete_rows,
+        smartsheet_sheet.id,
+        row_id_chunk
+    )
+
+    # Check if the deletion failed.
+    if delete_row_chunk_response.message != 'SUCCESS':
+        logger.error(f'An error occurred while trying to delete a chunk of '
+                     f'rows from the "{smartsheet_sheet.name}" Smartsheet')
+        return False
+
+    return True
+
+
+def delete_smartsheet_row_ids(smartsheet_sheet: SmartsheetSheet, row_ids: list[int]) -> bool:
+    """
+    Deletes the rows with the provided IDs from the provided Smartsheet. The
+    rows are deleted in chunks of SMARTSHEET_MAX_ROW_DELETION, one chunk at a
+    time, since concurrent writes to the same Smartsheet fail with error 4004.
+
+    Args:
+        smartsheet_sheet (SmartsheetSheet): The Smartsheet to delete the rows
+            in.
+        row_ids (list[int]): The IDs of the rows to delete.
+
+    Returns:
+        bool: True if all the rows were deleted, False otherwise.
+    """
+
+    # Split the row IDs into chunks.
+    row_id_chunks = [
+        row_ids[chunk_offset:chunk_offset + SMARTSHEET_MAX_ROW_DELETION]
+        for chunk_offset in range(0, len(row_ids), SMARTSHEET_MAX_ROW_DELETION)
+    ]
+
+    # Delete all the chunks of rows in the Smartsheet.
+    all_chunks_deleted = True
+    for row_id_chunk in row_id_chunks:
+        if not delete_smartsheet_row_chunk(smartsheet_sheet, row_id_chunk):
+            all_chunks_deleted = False
+
+    return all_chunks_deleted
+
+
+def delete_smartsheet_rows(smartsheet_sheet: SmartsheetSheet, smartsheet_rows: list[SmartsheetRow]) -> bool:
     """
     Deletes the provided rows from the provided Smartsheet. The list of rows 
     must be rows that exist inside the Smartsheet.
@@ -292,6 +622,9 @@ def delete_smartsheet_rows(smartsheet_sheet: SmartsheetSheet, smartsheet_rows: l
             in.
         smartsheet_rows (list[SmartsheetRow]): The rows to delete from the
             Smartsheet.
+
+    Returns:
+        bool: True if all the rows were deleted, False otherwise.
     """
 
     logger.info(f'Deleting {len(smartsheet_rows)} rows from Smartsheet "{smartsheet_sheet.name}"...')
@@ -305,70 +638,343 @@ def delete_smartsheet_rows(smartsheet_sheet: SmartsheetSheet, smartsheet_rows: l
     # Check if the Smartsheet is already empty.
     if len(all_row_ids) == 0:
         logger.info('Smartsheet already empty!')
-        return
+        return True
 
     # Delete the rows in chunks.
-    for chunk_offset in range(0, len(all_row_ids), SMARTSHEET_MAX_ROW_DELETION):
-        # Get the row ID chunk.
-        row_id_chunk = all_row_ids[chunk_offset:chunk_offset + SMARTSHEET_MAX_ROW_DELETION]
-
-        # Delete this chunk of rows in the Smartsheet.
-        delete_row_chunk_response = SMARTSHEET_CLIENT.Sheets.delete_rows(
-            smartsheet_sheet.id,
-            row_id_chunk
-        )
-
-        # Check if the deletion failed.
-        if delete_row_chunk_response.message != 'SUCCESS':
-            logger.error(f'An error occurred while trying to delete a chunk of '
-                         f'rows from the "{smartsheet_sheet.name}" Smartsheet')
-            logger.error(f'Result Code: {delete_row_chunk_response.result.code}')
-            continue
+    if not delete_smartsheet_row_ids(smartsheet_sheet, all_row_ids):
+        logger.error(f'Some rows in the "{smartsheet_sheet.name}" Smartsheet '
+                     f'could not be deleted')
+        return False
 
     logger.info(f'{len(smartsheet_rows)} rows in the "{smartsheet_sheet.name}" Smartsheet were '
                 f'deleted successfully!')
+    return True
 
 
-def add_rows_to_smartsheet(smartsheet_sheet: SmartsheetSheet, rows: list[SmartsheetRow]) -> None:
+def add_rows_to_smartsheet(smartsheet_sheet: SmartsheetSheet, rows: list[dict]) -> bool:
     """
-    Adds the provided list of rows to the provided Smartsheet.
+    Adds the provided list of rows to the provided Smartsheet. The rows are
+    added in chunks of SMARTSHEET_MAX_ROW_ADDITION so large datasets never
+    exceed a single request's payload limits.
 
     Args:
         smartsheet_sheet (SmartsheetSheet): The Smartsheet
             to add the rows to.
-        rows (list[SmartsheetRow]): The rows to add to
+        rows (list[dict]): The row payloads to add to
             the Smartsheet.
+
+    Returns:
+        bool: True if all the rows were added, False otherwise.
     """
 
     logger.info(f'Adding rows to the "{smartsheet_sheet.name}" Smartsheet...')
 
-    # Add all the rows to the Smartsheet.
-    add_all_rows_response = SMARTSHEET_CLIENT.Sheets.add_rows(
-        smartsheet_sheet.id,
-        rows
-    )
+    # Split the rows into chunks.
+    row_chunks = [
+        rows[chunk_offset:chunk_offset + SMARTSHEET_MAX_ROW_ADDITION]
+        for chunk_offset in range(0, len(rows), SMARTSHEET_MAX_ROW_ADDITION)
+    ]
+
+    # Add all the chunks of rows to the Smartsheet. Every row is added to the
+    # top of the Smartsheet, so the chunks are added from last to first to
+    # keep the rows in their original order.
+    all_chunks_added = True
+    for row_chunk in reversed(row_chunks):
+        add_row_chunk_response = send_smartsheet_request(
+            get_smartsheet_client().Sheets.add_rows,
+            smartsheet_sheet.id,
+            row_chunk
+        )
+
+        # Check if the addition failed.
+        if add_row_chunk_response.message != 'SUCCESS':
+            logger.error(f'An error occurred while adding a chunk of rows to '
+                         f'the "{smartsheet_sheet.name}" Smartsheet')
+            all_chunks_added = False
 
     # Output if the rows were added successfully or not.
-    if add_all_rows_response.message == 'SUCCESS':
+    if all_chunks_added:
         logger.info(f'All rows in the "{smartsheet_sheet.name}" Smartsheet '
                     f'were added successfully!')
-    else:
-        logger.error(f'An error occurred while adding rows to the '
-                     f'"{smartsheet_sheet.name}" Smartsheet')
-        logger.error(f'Result Code: {add_all_rows_response.result.code}')
+
+    return all_chunks_added
+
+
+def get_smartsheet_column_ids(smartsheet_sheet: SmartsheetSheet) -> tuple[int, ...]:
+    """
+    Given a Smartsheet, return the IDs of all its columns in column order.
+    The columns come with the Smartsheet that was already downloaded, so no
+    extra request is sent to Smartsheet.
+
+    Args:
+        smartsheet_sheet (SmartsheetSheet): The Smartsheet to get the column
+            IDs for.
+
+    Returns:
+        tuple[int, ...]: The IDs of the Smartsheet's columns.
+    """
+
+    return tuple(smartsheet_column.id for smartsheet_column in smartsheet_sheet.columns)
+
+
+def get_smartsheet_sheet(smartsheet_sheet_id: int) -> SmartsheetSheet:
+    """
+    Given a valid Smartsheet ID, return a reference to the Smartsheet with all
+    of its columns and rows. Cells that have never held a value are left out
+    of the response to keep it small.
+
+    Args:
+        smartsheet_sheet_id (int): The ID of the Smartsheet to get.
+
+    Returns:
+        SmartsheetSheet: The reference to the Smartsheet.
+
+    Raises:
+        SmartsheetApiError: If the Smartsheet could not be downloaded.
+    """
+
+    smartsheet_sheet = send_smartsheet_request(
+        get_smartsheet_client().Sheets.get_sheet,
+        smartsheet_sheet_id,
+        exclude='nonexistentCells'
+    )
+
+    # Check if the download failed, since every caller needs the Smartsheet's
+    # columns and rows.
+    if isinstance(smartsheet_sheet, SmartsheetError):
+        raise SmartsheetApiError(
+            smartsheet_sheet,
+            f'The Smartsheet with ID {smartsheet_sheet_id} could not be downloaded'
+        )
+
+    return smartsheet_sheet
+
+
+def update_rows_in_smartsheet(smartsheet_sheet: SmartsheetSheet, rows: list[dict]) -> bool:
+    """
+    Updates the provided list of rows in the provided Smartsheet. Every row
+    payload must have the ID of the Smartsheet row it updates. The rows are
+    updated in chunks of SMARTSHEET_MAX_ROW_ADDITION.
+
+    Args:
+        smartsheet_sheet (SmartsheetSheet): The Smartsheet
+            to update the rows in.
+        rows (list[dict]): The row payloads to update in
+            the Smartsheet.
+
+    Returns:
+        bool: True if all the rows were updated, False otherwise.
+    """
+
+    logger.info(f'Updating {len(rows)} rows in the "{smartsheet_sheet.name}" Smartsheet...')
+
+    # Split the rows into chunks.
+    row_chunks = [
+        rows[chunk_offset:chunk_offset + SMARTSHEET_MAX_ROW_ADDITION]
+        for chunk_offset in range(0, len(rows), SMARTSHEET_MAX_ROW_ADDITION)
+    ]
+
+    # Update all the chunks of rows in the Smartsheet.
+    all_chunks_updated = True
+    for row_chunk in row_chunks:
+        update_row_chunk_response = send_smartsheet_request(
+            get_smartsheet_client().Sheets.update_rows,
+            smartsheet_sheet.id,
+            row_chunk
+        )
+
+        # Check if the update failed.
+        if update_row_chunk_response.message != 'SUCCESS':
+            logger.error(f'An error occurred while updating a chunk of rows in '
+                         f'the "{smartsheet_sheet.name}" Smartsheet')
+            all_chunks_updated = False
+
+    # Output if the rows were updated successfully or not.
+    if all_chunks_updated:
+        logger.info(f'All rows in the "{smartsheet_sheet.name}" Smartsheet '
+                    f'were updated successfully!')
+
+    return all_chunks_updated
 
 
-def determine_primary_opsgenie_tag(opsgenie_tags: list[str]) -> str:
+def get_smartsheet_cell_text(cell_value) -> str:
     """
-    Given a list of strings representing all the tags in an Opsgenie alert,
-    return the primary tag. Priority is as follows:
+    Given the value of a Smartsheet cell, return it as text in the form
+    Smartsheet stores it, so values read from a Smartsheet can be compared
+    with the values of freshly built rows. Smartsheet trims text when it is
+    saved and stores numeric text as a number (so "2.0" reads back as 2),
+    which is why text is trimmed and numbers are written out as floats.
+    Empty cells are returned as an empty string.
+
+    Args:
+        cell_value: The value of the Smartsheet cell.
+
+    Returns:
+        str: The text of the cell value.
+    """
+
+    # Check if the cell is empty.
+    if cell_value is None:
+        return ''
+
+    # Write out numbers, and text that Smartsheet would store as a number, the
+    # same way.
+    cell_text = str(cell_value).strip()
+    try:
+        return str(float(cell_text))
+    except ValueError:
+        return cell_text
+
+
+def sync_smartsheet_rows(smartsheet_sheet: SmartsheetSheet, rows: list[dict], key_column_indexes: tuple[int, ...]) -> None:
+    """
+    Makes the provided Smartsheet hold the provided rows without clearing it
+    first. Rows are matched to the Smartsheet's existing rows by the values in
+    the key columns, and rows that share a key each get their own match.
+    Existing rows without a match are deleted, matched rows whose values
+    changed are updated in place, and the rest are added.
+
+    Args:
+        smartsheet_sheet (SmartsheetSheet): The Smartsheet to sync the rows
+            into. It must be fetched with its rows.
+        rows (list[dict]): The row payloads the Smartsheet should hold.
+        key_column_indexes (tuple[int, ...]): The indexes of the columns that
+            together identify a row.
+
+    Raises:
+        RuntimeError: If any of the rows could not be deleted, updated, or
+            added.
+    """
+
+    logger.info(f'Syncing rows in the "{smartsheet_sheet.name}" Smartsheet...')
+
+    # Get the IDs of the key columns.
+    column_ids = get_smartsheet_column_ids(smartsheet_sheet)
+    key_column_ids = tuple(column_ids[key_column_index] for key_column_index in key_column_indexes)
+
+    # Map the key of each existing row to the rows with that key and their
+    # cell values. Different rows can share a key (e.g. two PRTG sensors with
+    # the same name on one device), so every row with the key is kept.
+    existing_rows_by_key: dict[tuple[str, ...], list[tuple[SmartsheetRow, dict[int, str]]]] = {}
+    for existing_row in smartsheet_sheet.rows:
+        existing_row_values = {
+            existing_cell.column_id: get_smartsheet_cell_text(existing_cell.value)
+            for existing_cell in existing_row.cells
+        }
+        existing_row_key = tuple(existing_row_values.get(key_column_id, '') for key_column_id in key_column_ids)
+        existing_rows_by_key.setdefault(existing_row_key, []).append((existing_row, existing_row_values))
+
+    # Pair each row with one existing row that has its key, so rows sharing a
+    # key are all kept without being added and deleted again on every run.
+    # Rows that an existing row already holds exactly are paired first, so a
+    # changed row never takes the existing row of an unchanged one.
+    changed_rows: list[tuple[dict, tuple[str, ...]]] = []
+    for row in rows:
+        row_values = {cell['columnId']: get_smartsheet_cell_text(cell['value']) for cell in row['cells']}
+        row_key = tuple(row_values[key_column_id] for key_column_id in key_column_ids)
+
+        # Check if an existing row already holds exactly this row's values.
+        matching_existing_rows = existing_rows_by_key.get(row_key, [])
+        unchanged_existing_row = next(
+            (
+                existing_row_entry for existing_row_entry in matching_existing_rows
+                if all(existing_row_entry[1].get(column_id, '') == value for column_id, value in row_values.items())
+            ),
+            None
+        )
+        if unchanged_existing_row is None:
+            changed_rows.append((row, row_key))
+        else:
+            matching_existing_rows.remove(unchanged_existing_row)
+
+    # Sort the rest of the rows into rows that changed and rows that are new.
+    rows_to_update: list[dict] = []
+    rows_to_add: list[dict] = []
+    for row, row_key in changed_rows:
+        # Check if this row is not in the Smartsheet yet.
+        matching_existing_rows = existing_rows_by_key.get(row_key)
+        if not matching_existing_rows:
+            rows_to_add.append(row)
+            continue
+
+        # Update the first existing row left with this key in place.
+        existing_row, _ = matching_existing_rows.pop(0)
+        rows_to_update.append({'id': existing_row.id, 'cells': row['cells']})
+
+    # Every existing row that was not paired is stale.
+    stale_rows: list[SmartsheetRow] = [
+        existing_row
+        for matching_existing_rows in existing_rows_by_key.values()
+        for existing_row, _ in matching_existing_rows
+    ]
+
+    logger.info(f'{len(stale_rows)} stale, {len(rows_to_update)} changed, and '
+                f'{len(rows_to_add)} new rows found for the '
+                f'"{smartsheet_sheet.name}" Smartsheet')
+
+    # Check if the Smartsheet already holds every row as it should.
+    if len(stale_rows) == 0 and len(rows_to_update) == 0 and len(rows_to_add) == 0:
+        logger.info(f'The "{smartsheet_sheet.name}" Smartsheet is already up to date!')
+        return
+
+    # Delete the stale rows first so the Smartsheet never holds more rows than
+    # needed, then update the changed rows, and add the new rows to the top.
+    all_rows_synced = True
+    if len(stale_rows) != 0 and not delete_smartsheet_rows(smartsheet_sheet, stale_rows):
+        all_rows_synced = False
+    if len(rows_to_update) != 0 and not update_rows_in_smartsheet(smartsheet_sheet, rows_to_update):
+        all_rows_synced = False
+    if len(rows_to_add) != 0 and not add_rows_to_smartsheet(smartsheet_sheet, rows_to_add):
+        all_rows_synced = False
+
+    # Check if any part of the sync failed, so this customer's QBR automation
+    # is reported as failed.
+    if not all_rows_synced:
+        raise RuntimeError(f'Some rows in the "{smartsheet_sheet.name}" '
+                           f'Smartsheet could not be synced')
+
+    logger.info(f'Rows in the "{smartsheet_sheet.name}" Smartsheet synced!')
+
+
+def build_smartsheet_row(column_ids: tuple[int, ...], cell_values: tuple) -> dict:
+    """
+    Given the column IDs of a Smartsheet and the values for each of its
+    columns, build the payload of a Smartsheet row that will be added to the
+    top of the Smartsheet. The payload is a plain dictionary in the shape the
+    Smartsheet API expects, so no SDK model objects need to be built for it.
+
+    Args:
+        column_ids (tuple[int, ...]): The IDs of the Smartsheet's columns.
+        cell_values (tuple): The value of each cell in the row, in the same
+            order as the Smartsheet's columns.
+
+    Returns:
+        dict: The Smartsheet row payload containing the values.
+    """
+
+    return {
+        'toTop': True,
+        'cells': [
+            {'columnId': column_id, 'value': '' if cell_value is None else cell_value}
+            for column_id, cell_value in zip(column_ids, cell_values)
+        ]
+    }
+
+
+@lru_cache(maxsize=4096)
+def determine_primary_opsgenie_tag(opsgenie_tags: tuple[str, ...]) -> str:
+    """
+    Given a tuple of strings representing all the tags in an Opsgenie alert,
+    return the primary tag. Alerts from the same source share the same tags,
+    so the primary tag is cached per set of tags. Priority is as follows:
     [server > network > backup > storage > replication > virtualization] > 
     [vcenter > ucs > host > data protection advisor > aps > contact center] > 
     [snow > probe device] > 
     [catchall > misc]
 
     Args:
-        opsgenie_tags (list[str]): The list of tags from an Opsgenie alert.
+        opsgenie_tags (tuple[str, ...]): The tags from an Opsgenie alert, in
+            the order Opsgenie returned them in.
 
     Returns:
         str: The primary tag from the list of tags given based on priority.
@@ -457,137 +1063,89 @@ def determine_primary_opsgenie_tag(opsgenie_tags: list[str]) -> str:
     return primary_tag
 
 
-def opsgenie_alert_to_row(alert_data: OpsgenieBaseAlert, smartsheet_sheet: SmartsheetSheet) -> SmartsheetRow:
+def opsgenie_alert_to_row(alert_data: OpsgenieBaseAlert, column_ids: tuple[int, ...]) -> dict:
     """
-    Given an Opsgenie BaseAlert object and a valid Smartsheet object, convert
-    the base alert's data into a Smartsheet row object.
+    Given an Opsgenie BaseAlert object and the column IDs of a valid
+    Smartsheet, convert the base alert's data into a Smartsheet row object.
 
     Args:
         alert_data (OpsgenieBaseAlert): The alert data we want to convert.
-        sheet (SmartsheetSheet): The Smartsheet to create the Row
-            for.
+        column_ids (tuple[int, ...]): The column IDs of the Smartsheet to
+            create the Row for.
 
     Returns:
-        SmartsheetRow: The Smartsheet row object containing the 
+        dict: The Smartsheet row payload containing the 
             alert's data.
     """
 
-    # Initialize the row object we will be returning.
-    alert_row = SmartsheetRow()
-    alert_row.to_top = True
-
-    # Initialize the cell with the alert's alias.
-    alias_cell = SmartsheetCell()
-    alias_cell.column_id = smartsheet_sheet.columns[0].id
-    alias_cell.value = alert_data.alias
-
-    # Initialize the cell with the alert's type.
-    type_cell = SmartsheetCell()
-    type_cell.column_id = smartsheet_sheet.columns[1].id
-    type_cell.value = determine_primary_opsgenie_tag(alert_data.tags)
-
-    # Initialize the cell with the alert's message.
-    message_cell = SmartsheetCell()
-    message_cell.column_id = smartsheet_sheet.columns[2].id
-    message_cell.value = alert_data.message
-
-    # Initialize the cell with the alert's ID.
-    id_cell = SmartsheetCell()
-    id_cell.column_id = smartsheet_sheet.columns[3].id
-    id_cell.value = alert_data.id
-
-    # Initialize the cell with the alert's creation date (time will be
-    # truncated away).
-    created_at_date_only_cell = SmartsheetCell()
-    created_at_date_only_cell.column_id = smartsheet_sheet.columns[4].id
-    created_at_date_only_cell.value = alert_data.created_at.isoformat()
-
-    # Initialize the cell with the alert's creation date and time.
-    created_at_cell = SmartsheetCell()
-    created_at_cell.column_id = smartsheet_sheet.columns[5].id
-    created_at_cell.value = str(alert_data.created_at.strftime(TIMESTAMP_FORMAT))
-
-    # Initialize the cell with the alert's acknowledgement status.
-    ack_cell = SmartsheetCell()
-    ack_cell.column_id = smartsheet_sheet.columns[6].id
-    ack_cell.value = str(alert_data.acknowledged)
-
-    # Initialize the cell with the alert's status.
-    status_cell = SmartsheetCell()
-    status_cell.column_id = smartsheet_sheet.columns[7].id
-    status_cell.value = alert_data.status
-
-    # Initialize the cell with the alert's source.
-    source_cell = SmartsheetCell()
-    source_cell.column_id = smartsheet_sheet.columns[8].id
-    source_cell.value = alert_data.source
-
-    # Initialize the cell with the alert's count.
-    count_cell = SmartsheetCell()
-    count_cell.column_id = smartsheet_sheet.columns[9].id
-    count_cell.value = str(alert_data.count)
-
-    # Initialize the cell with the alert's priority.
-    priority_cell = SmartsheetCell()
-    priority_cell.column_id = smartsheet_sheet.columns[10].id
-    priority_cell.value = alert_data.priority
-
-    # Update the row object with the all the cell objects.
-    alert_row.cells.append(alias_cell)
-    alert_row.cells.append(type_cell)
-    alert_row.cells.append(message_cell)
-    alert_row.cells.append(id_cell)
-    alert_row.cells.append(created_at_date_only_cell)
-    alert_row.cells.append(created_at_cell)
-    alert_row.cells.append(ack_cell)
-    alert_row.cells.append(status_cell)
-    alert_row.cells.append(source_cell)
-    alert_row.cells.append(count_cell)
-    alert_row.cells.append(priority_cell)
+    # Gather the alert's data in the same order as the Smartsheet's columns.
+    alert_cell_values = (
+        alert_data.alias,                                         # Alias
+        determine_primary_opsgenie_tag(tuple(alert_data.tags)),   # Type
+        alert_data.message,                                       # Message
+        alert_data.id,                                            # ID
+        alert_data.created_at.date().isoformat(),                 # Created at date
+        alert_data.created_at.strftime(TIMESTAMP_FORMAT),         # Created at date and time
+        str(alert_data.acknowledged),                             # Acknowledged
+        alert_data.status,                                        # Status
+        alert_data.source,                                        # Source
+        str(alert_data.count),                                    # Count
+        alert_data.priority                                       # Priority
+    )
 
     # Return the row.
-    return alert_row
+    return build_smartsheet_row(column_ids, alert_cell_values)
 
 
-def get_quarterly_opsgenie_alerts(opsgenie_alert_tags: list[str]) -> list[OpsgenieBaseAlert]:
+@lru_cache(maxsize=1)
+def get_opsgenie_client() -> OpsgenieClient:
     """
-    Given a valid list of Opsgenie tags, return all alerts within the past 90
-    days with the provided tags.
+    Returns the connection to our Opsgenie instance. The connection is only
+    established on the first call and is reused by every call after that, so
+    the SDK's configuration and connection pool are only built once per run.
+    main() builds it before any customer thread starts, so concurrent first
+    calls never build more than one.
+
+    Returns:
+        OpsgenieClient: The connection to our Opsgenie instance.
+    """
+
+    return OpsgenieClient()
+
+
+def paginate_quarterly_opsgenie_alerts(opsgenie_alert_tags: list[str]):
+    """
+    Given a valid list of Opsgenie tags, yield pages of all alerts within the
+    past 90 days with the provided tags. The following pages keep being
+    fetched in the background while the caller works on the current one.
 
     Args:
         opsgenie_alert_tags (list[str]): The tags associated with the desired
             alerts.
 
-    Returns:
-        list[OpsgenieBaseAlert]: A list of quarterly alerts with the associated
+    Yields:
+        list[OpsgenieBaseAlert]: A page of quarterly alerts with the associated
             alert tags.
     """
 
     logger.info('Gathering quarterly Opsgenie alert data...')
 
-    # Establish a connection to our Opsgenie instance.
-    opsgenie_client = OpsgenieClient()
+    # Get the connection to our Opsgenie instance.
+    opsgenie_client = get_opsgenie_client()
     
     # Create a query for Opsgenie to get quarterly alerts.
-    date_90_days_ago = datetime.today() - timedelta(days=90)
     quarterly_alerts_query = \
-        f'createdAt >= {date_90_days_ago.strftime("%d-%m-%Y")} ' \
+        f'createdAt >= {OPSGENIE_QUARTER_START_DATE} ' \
         f'tag: ("{"\" OR \"".join(opsgenie_alert_tags)}")'
 
-    # Paginate over the quarterly Opsgenie alerts.
-    quarterly_alerts = list[OpsgenieBaseAlert]()
-    for opsgenie_alerts_page in opsgenie_client.paginate_opsgenie_alerts(quarterly_alerts_query):
-        # Add this alert to the list of quarterly alerts.
-        for opsgenie_alert in opsgenie_alerts_page:
-            quarterly_alerts.append(opsgenie_alert)
+    # Paginate over the quarterly Opsgenie alerts, handing each page to the
+    # caller as soon as it arrives.
+    yield from opsgenie_client.paginate_opsgenie_alerts(quarterly_alerts_query)
     
     logger.info('Opsgenie quarterly alert data gathered!')
 
-    # Return all the quarterly alerts.
-    return quarterly_alerts
-
 
-def convert_opsgenie_alerts_to_smartsheet_rows(opsgenie_alerts: list[OpsgenieBaseAlert], smartsheet_sheet: SmartsheetSheet) -> list[SmartsheetRow]:
+def convert_opsgenie_alerts_to_smartsheet_rows(opsgenie_alerts: list[OpsgenieBaseAlert], smartsheet_sheet: SmartsheetSheet) -> list[dict]:
     """
     Given a list of Opsgenie base alert objects and a desired Smartsheet sheet 
     object, convert the list of alerts to a list of Smartsheet row objects and
@@ -600,19 +1158,16 @@ def convert_opsgenie_alerts_to_smartsheet_rows(opsgenie_alerts: list[OpsgenieBas
             desired Smartsheet the alerts should go into.
 
     Returns:
-        list[SmartsheetRow]: The list of rows of the 
+        list[dict]: The list of row payloads of the 
         converted alert objects.
     """
 
-    # For each opsgenie alert, convert it into a Smartsheet row and add it to
-    # the returning list of Smartsheet rows.
-    all_alert_rows = list[SmartsheetRow]()
-    for opsgenie_alert in opsgenie_alerts:
-        opsgenie_alert_row = opsgenie_alert_to_row(opsgenie_alert, smartsheet_sheet)
-        all_alert_rows.append(opsgenie_alert_row)
-    
-    # Return all the alert rows.
-    return all_alert_rows
+    # Get the Smartsheet's column IDs once for all the rows.
+    column_ids = get_smartsheet_column_ids(smartsheet_sheet)
+
+    # Convert each Opsgenie alert into a Smartsheet row and return all the
+    # alert rows.
+    return [opsgenie_alert_to_row(opsgenie_alert, column_ids) for opsgenie_alert in opsgenie_alerts]
 
 
 def put_opsgenie_data_into_smartsheet(customer_config: dict) -> None:
@@ -624,137 +1179,121 @@ def put_opsgenie_data_into_smartsheet(customer_config: dict) -> None:
         customer_config (dict): The customer's configuration.
     """
 
-    # Get the quarterly Opsgenie data for this customer.
-    quarterly_opsgenie_alerts = get_quarterly_opsgenie_alerts(customer_config['opsgenie_tags'])
+    with ThreadPoolExecutor(max_workers=1) as smartsheet_executor:
+        # Start downloading this customer's Opsgenie alerts Smartsheet in the
+        # background while the first pages of alerts are requested.
+        opsgenie_smartsheet_future = smartsheet_executor.submit(
+            get_smartsheet_sheet,
+            customer_config['smartsheet_sheet_ids']['opsgenie_alerts']
+        )
 
-    # Get a reference to this customer's Opsgenie alerts Smartsheet.
-    opsgenie_smartsheet = SMARTSHEET_CLIENT.Sheets.get_sheet(customer_config['smartsheet_sheet_ids']['opsgenie_alerts'])
+        # Get the quarterly Opsgenie data for this customer and convert it to
+        # Smartsheet rows. Each page is converted while the next pages are
+        # still being fetched.
+        quarterly_opsgenie_alerts_rows: list[dict] = []
+        for quarterly_opsgenie_alerts_page in paginate_quarterly_opsgenie_alerts(customer_config['opsgenie_tags']):
+            quarterly_opsgenie_alerts_rows.extend(convert_opsgenie_alerts_to_smartsheet_rows(quarterly_opsgenie_alerts_page, opsgenie_smartsheet_future.result()))
 
-    # Convert the alerts to Smartsheet rows.
-    quarterly_opsgenie_alerts_rows = convert_opsgenie_alerts_to_smartsheet_rows(quarterly_opsgenie_alerts, opsgenie_smartsheet)
+        # Get the reference to the downloaded Smartsheet.
+        opsgenie_smartsheet = opsgenie_smartsheet_future.result()
 
-    # Clear the Smartsheet before pushing the fresh data.
-    clear_smartsheet(opsgenie_smartsheet)
+    # Sync the fresh rows into the Smartsheet.
+    sync_smartsheet_rows(opsgenie_smartsheet, quarterly_opsgenie_alerts_rows, OPSGENIE_SMARTSHEET_KEY_COLUMN_INDEXES)
 
-    # Add all the rows to Smartsheet.
-    add_rows_to_smartsheet(opsgenie_smartsheet, quarterly_opsgenie_alerts_rows)
 
-
-def servicenow_ticket_to_row(ticket_data: ServiceNowTicket, smartsheet_sheet: SmartsheetSheet) -> SmartsheetRow:
+def servicenow_ticket_to_row(ticket_data: ServiceNowTicket, column_ids: tuple[int, ...]) -> dict:
     """
-    Given a ServiceNow ticket object and a valid Smartsheet sheet object, convert 
-    the ticket's data into a Smartsheet row object.
+    Given a ServiceNow ticket object and the column IDs of a valid Smartsheet,
+    convert the ticket's data into a Smartsheet row object.
 
     Args:
         ticket_data (ServiceNowTicket): The ticket data we want to convert.
-        smartsheet_sheet (SmartsheetSheet): The
+        column_ids (tuple[int, ...]): The column IDs of the
             Smartsheet to create the rows for.
 
     Returns:
-        SmartsheetRow: The Smartsheet row object
+        dict: The Smartsheet row payload
             containing the ticket's data.
     """
 
-    # Initialize the row object we will be returning.
-    ticket_row = smartsheet.models.Row()
-    ticket_row.to_top = True
-
-    # Initialize the cell with the ticket's number.
-    number_cell = SmartsheetCell()
-    number_cell.column_id = smartsheet_sheet.columns[0].id
-    number_cell.value = ticket_data.number
-
-    # Initialize the cell with the ticket's location.
-    location_cell = SmartsheetCell()
-    location_cell.column_id = smartsheet_sheet.columns[1].id
-    location_cell.value = ticket_data.location
-
-    # Initialize the cell with the ticket's CMDB CI name.
-    ci_cell = SmartsheetCell()
-    ci_cell.column_id = smartsheet_sheet.columns[2].id
-    ci_cell.value = ticket_data.cmdb_ci
-
-    # Initialize the cell with the ticket's short description.
-    short_description_cell = SmartsheetCell()
-    short_description_cell.column_id = smartsheet_sheet.columns[3].id
-    short_description_cell.value = ticket_data.short_description
-
-    # Initialize the cell with the ticket's state.
-    state_cell = SmartsheetCell()
-    state_cell.column_id = smartsheet_sheet.columns[4].id
-    state_cell.value = ticket_data.state
-
-    # Initialize the cell with the ticket's category.
-    category_cell = SmartsheetCell()
-    category_cell.column_id = smartsheet_sheet.columns[5].id
-    category_cell.value = ticket_data.category
-
-    # Initialize the cell with the ticket's priority.
-    priority_cell = SmartsheetCell()
-    priority_cell.column_id = smartsheet_sheet.columns[6].id
-    priority_cell.value = ticket_data.priority
-
-    # Initialize the cell with the ticket's risk.
-    risk_cell = SmartsheetCell()
-    risk_cell.column_id = smartsheet_sheet.columns[7].id
-    risk_cell.value = ticket_data.risk
-
-    # Initialize the cell with the ticket's assigned to.
-    assigned_to_cell = SmartsheetCell()
-    assigned_to_cell.column_id = smartsheet_sheet.columns[8].id
-    assigned_to_cell.value = ticket_data.assigned_to
-
-    # Initialize the cell with the ticket's opened at date (time will be
-    # truncated away).
-    opened_at_date_cell = SmartsheetCell()
-    opened_at_date_cell.column_id = smartsheet_sheet.columns[9].id
-    opened_at_date_cell.value = ticket_data.opened_at.isoformat()
-
-    # Initialize the cell with the ticket's opened at date and time.
-    opened_at_datetime_cell = SmartsheetCell()
-    opened_at_datetime_cell.column_id = smartsheet_sheet.columns[10].id
-    opened_at_datetime_cell.value = str(ticket_data.opened_at.strftime(TIMESTAMP_FORMAT))
-
-    # Initialize the cell with the ticket's updated by.
-    updated_by_cell = SmartsheetCell()
-    updated_by_cell.column_id = smartsheet_sheet.columns[11].id
-    updated_by_cell.value = ticket_data.updated_by
-
-    # Initialize the cell with the ticket's closed at date (time will be
-    # truncated away).
-    closed_at_date_cell = SmartsheetCell()
-    closed_at_date_cell.column_id = smartsheet_sheet.columns[12].id
-    closed_at_date_cell.value = '' if ticket_data.closed_at == None else ticket_data.closed_at.isoformat()
-
-    # Initialize the cell with the ticket's closed at date and time.
-    closed_at_datetime_cell = SmartsheetCell()
-    closed_at_datetime_cell.column_id = smartsheet_sheet.columns[13].id
-    closed_at_datetime_cell.value = '' if ticket_data.closed_at == None else str(ticket_data.closed_at.strftime(TIMESTAMP_FORMAT))
-
-    # Initialize the cell with the ticket's resolution time in days.
-    resolution_time_in_days_cell = SmartsheetCell()
-    resolution_time_in_days_cell.column_id = smartsheet_sheet.columns[14].id
-    resolution_time_in_days_cell.value = str(abs(round(ticket_data.resolve_time, 2))) if ticket_data.resolve_time != '' else ''
-
-    # Update the row object with the all the cell objects.
-    ticket_row.cells.append(number_cell)
-    ticket_row.cells.append(location_cell)
-    ticket_row.cells.append(ci_cell)
-    ticket_row.cells.append(short_description_cell)
-    ticket_row.cells.append(state_cell)
-    ticket_row.cells.append(category_cell)
-    ticket_row.cells.append(priority_cell)
-    ticket_row.cells.append(risk_cell)
-    ticket_row.cells.append(assigned_to_cell)
-    ticket_row.cells.append(opened_at_date_cell)
-    ticket_row.cells.append(opened_at_datetime_cell)
-    ticket_row.cells.append(updated_by_cell)
-    ticket_row.cells.append(closed_at_date_cell)
-    ticket_row.cells.append(closed_at_datetime_cell)
-    ticket_row.cells.append(resolution_time_in_days_cell)
+    # Determine the ticket's closed at date and time and its resolution time
+    # in days (blank if the ticket is still open).
+    closed_at_date = '' if ticket_data.closed_at == None else ticket_data.closed_at.date().isoformat()
+    closed_at_datetime = '' if ticket_data.closed_at == None else ticket_data.closed_at.strftime(TIMESTAMP_FORMAT)
+    resolution_time_in_days = str(abs(round(ticket_data.resolve_time, 2))) if ticket_data.resolve_time != '' else ''
+
+    # Gather the ticket's data in the same order as the Smartsheet's columns.
+    ticket_cell_values = (
+        ticket_data.number,                                     # Number
+        ticket_data.location,                                   # Location
+        ticket_data.cmdb_ci,                                    # CMDB CI name
+        ticket_data.short_description,                          # Short description
+        ticket_data.state,                                      # State
+        ticket_data.category,                                   # Category
+        ticket_data.priority,                                   # Priority
+        ticket_data.risk,                                       # Risk
+        ticket_data.assigned_to,                                # Assigned to
+        ticket_data.opened_at.date().isoformat(),               # Opened at date
+        ticket_data.opened_at.strftime(TIMESTAMP_FORMAT),       # Opened at date and time
+        ticket_data.updated_by,                                 # Updated by
+        closed_at_date,                                         # Closed at date
+        closed_at_datetime,                                     # Closed at date and time
+        resolution_time_in_days                                 # Resolution time in days
+    )
 
     # Return the row.
-    return ticket_row
+    return build_smartsheet_row(column_ids, ticket_cell_values)
+
+
+def get_servicenow_table_tickets(servicenow_table_name: str, query: pysnow.QueryBuilder) -> list[ServiceNowTicket]:
+    """
+    Given a ServiceNow table name and a query, return the tickets from that
+    table that match the query. The response is streamed so each raw ticket
+    is converted as soon as it is parsed, rather than holding every raw
+    ticket dictionary in memory first.
+
+    Args:
+        servicenow_table_name (str): The name of the ServiceNow table to get
+            the tickets from.
+        query (pysnow.QueryBuilder): The query to filter the table's tickets
+            with.
+
+    Returns:
+        list[ServiceNowTicket]: The hard-typed tickets from the table, in the
+            order ServiceNow returned them in.
+    """
+
+    # Get a reference to the ServiceNow table.
+    servicenow_table = SERVICENOW_CLIENT.resource(api_path=f'/table/{servicenow_table_name}')
+
+    # Gather the ticket data from the table. Since the query sorts latest
+    # tickets first, no more tickets than fit on the dashboard are needed.
+    servicenow_table_response = servicenow_table.get(
+        query=query,
+        limit=SMARTSHEET_MAX_DASHBOARD_ROW_COUNT,
+        fields=SERVICENOW_TICKET_FIELDS,
+        stream=True
+    )
+
+    # Convert all the raw ServiceNow ticket dictionaries to hard-typed
+    # ServiceNow ticket objects and return the tickets from the table.
+    return [
+        ServiceNowTicket(
+            servicenow_raw_ticket['number'],
+            servicenow_raw_ticket['location.name'],
+            servicenow_raw_ticket['cmdb_ci.name'],
+            servicenow_raw_ticket['short_description'],
+            servicenow_raw_ticket['state'],
+            servicenow_raw_ticket.get('category', None),
+            servicenow_raw_ticket['priority'],
+            servicenow_raw_ticket.get('risk', None),
+            servicenow_raw_ticket['assigned_to.name'],
+            servicenow_raw_ticket['opened_at'],
+            servicenow_raw_ticket['sys_updated_by'],
+            servicenow_raw_ticket['closed_at']
+        )
+        for servicenow_raw_ticket in servicenow_table_response.all()
+    ]
 
 
 def get_quarterly_servicenow_tickets(servicenow_company_names: list[str]) -> list[ServiceNowTicket]:
@@ -772,14 +1311,8 @@ def get_quarterly_servicenow_tickets(servicenow_company_names: list[str]) -> lis
 
     logger.info('Gathering quarterly ServiceNow ticket data...')
 
-    # Get relevant ServiceNow tables.
-    servicenow_incident_table = SERVICENOW_CLIENT.resource(api_path='/table/incident')
-    servicenow_request_item_table = SERVICENOW_CLIENT.resource(api_path='/table/sc_req_item')
-    servicenow_change_request_table = SERVICENOW_CLIENT.resource(api_path='/table/change_request')
-
     # Build the query to get the quarterly tickets from the tables.
-    date_90_days_ago = datetime.today() - timedelta(days=90)
-    tickets_last_90_days_query = pysnow.QueryBuilder().field('sys_created_on').greater_than_or_equal(date_90_days_ago).AND()
+    tickets_last_90_days_query = pysnow.QueryBuilder().field('sys_created_on').greater_than_or_equal(QUARTER_START_DATE).AND()
     query_ends_with_and = True
     for company_name in servicenow_company_names:
         # Check if this is the first loop so we exclude the "OR".
@@ -789,67 +1322,39 @@ def get_quarterly_servicenow_tickets(servicenow_company_names: list[str]) -> lis
         else:
             tickets_last_90_days_query = tickets_last_90_days_query.OR().field('company.name').equals(company_name)
 
-    # Gather quarterly ticket data from the incident table.
-    servicenow_quarterly_incidents_response = servicenow_incident_table.get(
-        query=tickets_last_90_days_query,
-        fields=SERVICENOW_TICKET_FIELDS
-    )
-    servicenow_quarterly_incidents = servicenow_quarterly_incidents_response.all()
-
-    # Gather quarterly ticket data from the request item table.
-    servicenow_quarterly_request_items_response = servicenow_request_item_table.get(
-        query=tickets_last_90_days_query,
-        fields=SERVICENOW_TICKET_FIELDS
-    )
-    servicenow_quarterly_request_items = servicenow_quarterly_request_items_response.all()
-
-    # Gather quarterly ticket data from the change request table.
-    servicenow_quarterly_change_requests_response = servicenow_change_request_table.get(
-        query=tickets_last_90_days_query,
-        fields=SERVICENOW_TICKET_FIELDS
-    )
-    servicenow_quarterly_change_requests = servicenow_quarterly_change_requests_response.all()
-
-    # Combine all quarterly ticket lists into a single list.
-    all_raw_quarterly_tickets = (
-        servicenow_quarterly_incidents + 
-        servicenow_quarterly_request_items + 
-        servicenow_quarterly_change_requests
-    )
-
-    # Convert all the raw ServiceNow ticket dictionaries to hard-typed ServiceNow ticket objects.
-    all_servicenow_quarterly_tickets = list[ServiceNowTicket]()
-    for servicenow_raw_ticket in all_raw_quarterly_tickets:
-        servicenow_ticket = ServiceNowTicket(
-            servicenow_raw_ticket['number'],
-            servicenow_raw_ticket['location.name'],
-            servicenow_raw_ticket['cmdb_ci.name'],
-            servicenow_raw_ticket['short_description'],
-            servicenow_raw_ticket['state'],
-            servicenow_raw_ticket.get('category', None),
-            servicenow_raw_ticket['priority'],
-            servicenow_raw_ticket.get('risk', None),
-            servicenow_raw_ticket['assigned_to.name'],
-            servicenow_raw_ticket['opened_at'],
-            servicenow_raw_ticket['sys_updated_by'],
-            servicenow_raw_ticket['closed_at']
-        )
-        all_servicenow_quarterly_tickets.append(servicenow_ticket)
-
-    # Sort the quarterly tickets by date opened (latest tickets at the top).
-    all_servicenow_quarterly_tickets = sorted(all_servicenow_quarterly_tickets, key=lambda ticket: ticket.opened_at)
-    all_servicenow_quarterly_tickets.reverse()
+    # Have ServiceNow sort each table's tickets by date opened (latest
+    # tickets first), so the tables only need to be merged afterwards.
+    if not query_ends_with_and:
+        tickets_last_90_days_query = tickets_last_90_days_query.AND()
+    tickets_last_90_days_query = tickets_last_90_days_query.field('opened_at').order_descending()
+
+    # Gather quarterly ticket data from all the ticket tables at the same
+    # time, since each table is queried independently.
+    with ThreadPoolExecutor(max_workers=len(SERVICENOW_TICKET_TABLES)) as servicenow_executor:
+        servicenow_table_futures = [
+            servicenow_executor.submit(get_servicenow_table_tickets, servicenow_table_name, tickets_last_90_days_query)
+            for servicenow_table_name in SERVICENOW_TICKET_TABLES
+        ]
+
+        # Merge the already sorted ticket lists from each table into a single
+        # list sorted by date opened (latest tickets at the top), stopping
+        # once the dashboard's row limit is reached.
+        all_servicenow_quarterly_tickets = list(islice(
+            heapq.merge(
+                *(servicenow_table_future.result() for servicenow_table_future in servicenow_table_futures),
+                key=attrgetter('opened_at'),
+                reverse=True
+            ),
+            SMARTSHEET_MAX_DASHBOARD_ROW_COUNT
+        ))
 
     logger.info('ServiceNow quarterly ticket data gathered!')
 
     # Return the quarterly tickets for this customer.
-    if len(all_servicenow_quarterly_tickets) > SMARTSHEET_MAX_DASHBOARD_ROW_COUNT:
-        return all_servicenow_quarterly_tickets[:SMARTSHEET_MAX_DASHBOARD_ROW_COUNT]
-    
     return all_servicenow_quarterly_tickets
 
 
-def convert_servicenow_tickets_to_smartsheet_rows(servicenow_tickets: list[ServiceNowTicket], smartsheet_sheet: SmartsheetSheet) -> list[SmartsheetRow]:
+def convert_servicenow_tickets_to_smartsheet_rows(servicenow_tickets: list[ServiceNowTicket], smartsheet_sheet: SmartsheetSheet) -> list[dict]:
     """
     Given a list of ServiceNow tickets and a desired Smartsheet sheet object,
     convert the list of tickets to a list of Smartsheet row objects and return
@@ -862,19 +1367,15 @@ def convert_servicenow_tickets_to_smartsheet_rows(servicenow_tickets: list[Servi
             desired Smartsheet the tickets should go into.
     
     Returns:
-        list[SmartsheetRow]: The list of rows of the
+        list[dict]: The list of row payloads of the
             converted tickets.
     """
 
-    # For each ticket, convert it into a Smartsheet row and add it to the
-    # returning list of Smartsheet rows.
-    all_ticket_rows = list[SmartsheetRow]()
-    for servicenow_ticket in servicenow_tickets:
-        servicenow_ticket_row = servicenow_ticket_to_row(servicenow_ticket, smartsheet_sheet)
-        all_ticket_rows.append(servicenow_ticket_row)
+    # Get the Smartsheet's column IDs once for all the rows.
+    column_ids = get_smartsheet_column_ids(smartsheet_sheet)
 
-    # Return all the ticket rows.
-    return all_ticket_rows
+    # Convert each ticket into a Smartsheet row and return all the ticket rows.
+    return [servicenow_ticket_to_row(servicenow_ticket, column_ids) for servicenow_ticket in servicenow_tickets]
 
 
 def put_servicenow_data_into_smartsheet(customer_config: dict) -> None:
@@ -886,82 +1387,146 @@ def put_servicenow_data_into_smartsheet(customer_config: dict) -> None:
         customer_config (dict): The customer's configuration.
     """
 
-    # Get the quarterly ServiceNow tickets for this customer.
-    quarterly_servicenow_tickets = get_quarterly_servicenow_tickets(customer_config['servicenow_company_names'])
+    with ThreadPoolExecutor(max_workers=1) as smartsheet_executor:
+        # Start downloading this customer's ServiceNow ticket Smartsheet in
+        # the background while the tickets are gathered.
+        servicenow_smartsheet_future = smartsheet_executor.submit(
+            get_smartsheet_sheet,
+            customer_config['smartsheet_sheet_ids']['servicenow_tickets']
+        )
+
+        # Get the quarterly ServiceNow tickets for this customer.
+        quarterly_servicenow_tickets = get_quarterly_servicenow_tickets(customer_config['servicenow_company_names'])
 
-    # Get a reference to this customer's ServiceNow ticket Smartsheet.
-    servicenow_smartsheet = SMARTSHEET_CLIENT.Sheets.get_sheet(customer_config['smartsheet_sheet_ids']['servicenow_tickets'])
+        # Get the reference to the downloaded Smartsheet.
+        servicenow_smartsheet = servicenow_smartsheet_future.result()
 
     # Convert the alerts to Smartsheet rows.
     quarterly_servicenow_tickets_rows = convert_servicenow_tickets_to_smartsheet_rows(quarterly_servicenow_tickets, servicenow_smartsheet)
 
-    # Clear the Smartsheet before pushing the fresh data.
-    clear_smartsheet(servicenow_smartsheet)
-
-    # Add all the rows to Smartsheet.
-    add_rows_to_smartsheet(servicenow_smartsheet, quarterly_servicenow_tickets_rows)
+    # Sync the fresh rows into the Smartsheet.
+    sync_smartsheet_rows(servicenow_smartsheet, quarterly_servicenow_tickets_rows, SERVICENOW_SMARTSHEET_KEY_COLUMN_INDEXES)
 
 
-def prtg_sensor_to_row(prtg_sensor: PRTGSensor, smartsheet_sheet: SmartsheetSheet) -> SmartsheetRow:
+def prtg_sensor_to_row(prtg_sensor: PRTGSensor, column_ids: tuple[int, ...]) -> dict:
     """
     Given a PRTG sensor object, convert the sensor's data into a Smartsheet row
     object.
 
     Args:
         prtg_sensor (PRTGSensor): The sensor data we want to convert.
-        smartsheet_sheet (SmartsheetSheet): The 
+        column_ids (tuple[int, ...]): The column IDs of the
             Smartsheet we want to insert the row into.
 
     Returns:
-        SmartsheetRow: The Smartsheet row object 
+        dict: The Smartsheet row payload 
             containing the sensor's data.
     """
 
-    # Initialize the row object we will be returning.
-    sensor_row = smartsheet.models.Row()
-    sensor_row.to_top = True
+    # Gather the sensor's data in the same order as the Smartsheet's columns.
+    sensor_cell_values = (
+        prtg_sensor.status,                                 # Status
+        prtg_sensor.downtime_since,                         # Occurrence timestamp
+        prtg_sensor.name,                                   # Name
+        f'{prtg_sensor.probe} > {prtg_sensor.group} > '
+            f'{prtg_sensor.device}',                        # Probe / group / device
+        prtg_sensor.message                                 # Message
+    )
+
+    # Return the row.
+    return build_smartsheet_row(column_ids, sensor_cell_values)
+
+
+def get_minimal_prtg_probe_substrings(probe_substrings: list[str]) -> tuple[str, ...]:
+    """
+    Given a list of PRTG probe substrings, return the smallest set of them
+    that still matches the same probes. Duplicates are dropped, as is any
+    substring that contains another substring from the list, since every
+    probe it matches is already matched by the shorter one.
+
+    Args:
+        probe_substrings (list[str]): The probe substrings to filter on.
 
-    # Initialize the cell with the sensor's status.
-    status_cell = SmartsheetCell()
-    status_cell.column_id = smartsheet_sheet.columns[0].id
-    status_cell.value = prtg_sensor.status
+    Returns:
+        tuple[str, ...]: The probe substrings that are needed, in their
+            original order.
+    """
 
-    # Initialize the cell with the sensor's occurrance timestamp.
-    occurred_cell = SmartsheetCell()
-    occurred_cell.column_id = smartsheet_sheet.columns[1].id
-    occurred_cell.value = prtg_sensor.downtime_since
+    # Remove duplicate substrings while keeping their order.
+    unique_probe_substrings = tuple(dict.fromkeys(probe_substrings))
+
+    # Keep only the substrings that do not contain any other substring.
+    return tuple(
+        probe_substring for probe_substring in unique_probe_substrings
+        if not any(
+            other_probe_substring != probe_substring and other_probe_substring in probe_substring
+            for other_probe_substring in unique_probe_substrings
+        )
+    )
 
-    # Initialize the cell with the sensor's name.
-    name_cell = SmartsheetCell()
-    name_cell.column_id = smartsheet_sheet.columns[2].id
-    name_cell.value = prtg_sensor.name
 
-    # Initialize the cell with the sensor's probe / group / device.
-    probe_group_device_cell = SmartsheetCell()
-    probe_group_device_cell.column_id = smartsheet_sheet.columns[3].id
-    probe_group_device_cell.value = prtg_sensor.probe + ' > ' + \
-        prtg_sensor.group + ' > ' + prtg_sensor.device
+def get_prtg_instance_sensors(prtg_instance_data: dict) -> list[PRTGSensor]:
+    """
+    Return all non-online sensors from the provided PRTG instance across all
+    of its probes (or only the probes matching the instance's probe
+    substrings, if there are any).
 
-    # Initialize the cell with the sensor's message.
-    message_cell = SmartsheetCell()
-    message_cell.column_id = smartsheet_sheet.columns[4].id
-    message_cell.value = prtg_sensor.message
+    Args:
+        prtg_instance_data (dict): The PRTG instance's data for this
+            customer.
 
-    # Update the row object with the all the cell objects.
-    sensor_row.cells.append(status_cell)
-    sensor_row.cells.append(occurred_cell)
-    sensor_row.cells.append(name_cell)
-    sensor_row.cells.append(probe_group_device_cell)
-    sensor_row.cells.append(message_cell)
+    Returns:
+        list[PRTGSensor]: A list of hard-typed PRTG sensor objects.
+    """
 
-    # Return the row.
-    return sensor_row
+    # Check if we are using a default PRTG instance.
+    if prtg_instance_data['url'] in PRTG_DEFAULT_INSTANCES:
+        prtg_instance_url, prtg_api_key = PRTG_DEFAULT_INSTANCES[prtg_instance_data['url']]
+    else:
+        prtg_instance_url = prtg_instance_data['url']
+        prtg_api_key = prtg_instance_data['api_key']
+    full_prtg_url = f'{prtg_instance_url}/api/table.xml'
+        
+    # Create the parameters for the PRTG API payload from the parameters
+    # shared by every instance.
+    prtg_api_parameters = {**PRTG_SENSOR_API_PARAMETERS, 'apitoken': prtg_api_key}
+    
+    # Check if we need to add any filters to the probe. PRTG ORs together
+    # repeated filters on the same column.
+    if len(prtg_instance_data['probe_substrings']) != 0:
+        prtg_api_parameters['filter_probe'] = tuple(
+            f'@sub({probe_substring})'
+            for probe_substring in get_minimal_prtg_probe_substrings(prtg_instance_data['probe_substrings'])
+        )
+        
+    # Send the request to PRTG, giving up on an instance that stops
+    # responding instead of hanging the whole run.
+    prtg_raw_sensors_resp = PRTG_SESSION.get(
+        url=full_prtg_url,
+        params=prtg_api_parameters,
+        timeout=PRTG_REQUEST_TIMEOUT_SECONDS
+    )
+    
+    # Extract just the sensors from the response. The response can hold
+    # thousands of sensors, so it is parsed with orjson.
+    prtg_raw_sensors = orjson.loads(prtg_raw_sensors_resp.content)['sensors']
+
+    # Convert all the raw PRTG sensor dictionaries to hard-typed PRTG sensor
+    # objects and return this PRTG instance's sensors.
+    return [
+        PRTGSensor(prtg_raw_sensor['name'], prtg_raw_sensor['parentid'],
+                   prtg_raw_sensor['downtimesince'], prtg_raw_sensor['status'],
+                   prtg_raw_sensor['probe'], prtg_raw_sensor['group'],
+                   prtg_raw_sensor['device'], prtg_raw_sensor['message_raw'])
+        for prtg_raw_sensor in prtg_raw_sensors
+    ]
 
 
 def get_alerting_prtg_sensors(prtg_instances: list[dict]) -> list[PRTGSensor]:
     """
     Return all non-online sensors from all provided PRTG instances with their
-    respective credentials across all probes.
+    respective credentials across all probes. Up to
+    PRTG_MAX_CONCURRENT_INSTANCES PRTG instances are queried at the same time.
 
     Args:
         prtg_instances_data(list[dict]): A list of all PRTG instances data for 
@@ -973,66 +1538,24 @@ def get_alerting_prtg_sensors(prtg_instances: list[dict]) -> list[PRTGSensor]:
 
     logger.info('Gathering PRTG sensor data...')
 
-    # Get the raw sensors from each PRTG instance.
-    all_prtg_sensors = list[PRTGSensor]()
-    for prtg_instance_data in prtg_instances:
-        # Check if we are using a default PRTG instance.
-        if prtg_instance_data['url'] == PRTG_01_USE_DEFAULTS_KEYWORD:
-            full_prtg_url = f'{PRTG_01_DEFAULT_INSTANCE_URL}/api/table.xml'
-            prtg_api_key = PRTG_01_DEFAULT_API_KEY
-        elif prtg_instance_data['url'] == PRTG_02_USE_DEFAULTS_KEYWORD:
-            full_prtg_url = f'{PRTG_02_DEFAULT_INSTANCE_URL}/api/table.xml'
-            prtg_api_key = PRTG_02_DEFAULT_API_KEY
-        else:
-            full_prtg_url = f'{prtg_instance_data['url']}/api/table.xml'
-            prtg_api_key = prtg_instance_data['api_key']
-            
-        # Create the parameters for the PRTG API payload.
-        prtg_api_parameters = {
-                'content': 'sensors',
-                'columns': 'name,parentid,downtimesince,status,' \
-                           'probe,group,device,message',
-                'filter_status': '@neq(3)',
-                'output': 'json',
-                'count': str(PRTG_MAX_RESPONSE_LIMIT),
-                'apitoken': prtg_api_key
-        }
-        
-        # Check if we need to add any filters to the probe.
-        if len(prtg_instance_data['probe_substrings']) != 0:
-            prtg_api_parameters['filter_probe'] = [f'@sub({probe_substring})' for probe_substring in prtg_instance_data['probe_substrings']]
-            
-        # Send the request to PRTG.
-        prtg_raw_sensors_resp = requests.get(
-            url=full_prtg_url,
-            params=prtg_api_parameters
-        )
-        
-        # Extract just the sensors from the response.
-        prtg_raw_sensors = prtg_raw_sensors_resp.json()['sensors']
-
-        # Convert all the raw PRTG sensor dictionaries to hard-typed PRTG sensor objects.
-        prtg_sensors = list[PRTGSensor]()
-        for prtg_raw_sensor in prtg_raw_sensors:
-            prtg_sensor = PRTGSensor(prtg_raw_sensor['name'], prtg_raw_sensor['parentid'],
-                                     prtg_raw_sensor['downtimesince'], prtg_raw_sensor['status'],
-                                     prtg_raw_sensor['probe'], prtg_raw_sensor['group'],
-                                     prtg_raw_sensor['device'], prtg_raw_sensor['message_raw'])
-            prtg_sensors.append(prtg_sensor)
-
-        # Add this PRTG instance's sensors to the customer's global sensor
-        # list.
-        all_prtg_sensors.extend(prtg_sensors)
+    # Get the sensors from each PRTG instance at the same time.
+    all_prtg_sensors: list[PRTGSensor] = []
+    with ThreadPoolExecutor(max_workers=max(min(len(prtg_instances), PRTG_MAX_CONCURRENT_INSTANCES), 1)) as prtg_executor:
+        for prtg_sensors in prtg_executor.map(get_prtg_instance_sensors, prtg_instances):
+            # Add this PRTG instance's sensors to the customer's global sensor
+            # list.
+            all_prtg_sensors.extend(prtg_sensors)
+
+    # Drop any sensors that do not fit on the dashboard in place, rather than
+    # copying the ones that do.
+    del all_prtg_sensors[SMARTSHEET_MAX_DASHBOARD_ROW_COUNT:]
 
     # Return all the PRTG sensor data.
     logger.info('PRTG sensor data gathered!')
-    if len(all_prtg_sensors) > SMARTSHEET_MAX_DASHBOARD_ROW_COUNT:
-        return all_prtg_sensors[:SMARTSHEET_MAX_DASHBOARD_ROW_COUNT]
-    
     return all_prtg_sensors
     
 
-def convert_prtg_sensors_to_smartsheet_rows(prtg_sensors: list[PRTGSensor], smartsheet_sheet: SmartsheetSheet) -> list[SmartsheetRow]:
+def convert_prtg_sensors_to_smartsheet_rows(prtg_sensors: list[PRTGSensor], smartsheet_sheet: SmartsheetSheet) -> list[dict]:
     """
     Given a list of PRTG sensors and a desired Smartsheet sheet object, convert
     the list of sensors to a list of Smartsheet row objects and return the list
@@ -1045,19 +1568,15 @@ def convert_prtg_sensors_to_smartsheet_rows(prtg_sensors: list[PRTGSensor], smar
             desired Smartsheet the sensors should go into.
     
     Returns:
-        list[SmartsheetRow]: The list of rows of the
+        list[dict]: The list of row payloads of the
             converted sensors.
     """
     
-    # For each sensor, convert it into a Smartsheet row and add it to the
-    # returning list of Smartsheet rows.
-    all_sensor_rows = list[SmartsheetRow]()
-    for prtg_sensor in prtg_sensors:
-        prtg_sensor_row = prtg_sensor_to_row(prtg_sensor, smartsheet_sheet)
-        all_sensor_rows.append(prtg_sensor_row)
+    # Get the Smartsheet's column IDs once for all the rows.
+    column_ids = get_smartsheet_column_ids(smartsheet_sheet)
 
-    # Return all the sensor rows.
-    return all_sensor_rows
+    # Convert each sensor into a Smartsheet row and return all the sensor rows.
+    return [prtg_sensor_to_row(prtg_sensor, column_ids) for prtg_sensor in prtg_sensors]
 
 
 def put_prtg_sensor_data_into_smartsheet(customer_config: dict) -> None:
@@ -1071,62 +1590,142 @@ def put_prtg_sensor_data_into_smartsheet(customer_config: dict) -> None:
     
     # Check if there are no PRTG instance URLs in the config.
     if len(customer_config['prtg_instances']) == 0:
-        logger.info(f'No PRTG instances set for {customer_config['customer_name']}!')
+        logger.info('No PRTG instances set for {}!', customer_config['customer_name'])
         return
 
-    # Get the current alerting PRTG sensors for this customer.
-    current_alerting_prtg_sensors = get_alerting_prtg_sensors(
-        customer_config['prtg_instances']
-    )
+    with ThreadPoolExecutor(max_workers=1) as smartsheet_executor:
+        # Start downloading this customer's PRTG sensor Smartsheet in the
+        # background while the sensors are gathered.
+        prtg_smartsheet_future = smartsheet_executor.submit(
+            get_smartsheet_sheet,
+            customer_config['smartsheet_sheet_ids']['prtg_alerts']
+        )
+
+        # Get the current alerting PRTG sensors for this customer.
+        current_alerting_prtg_sensors = get_alerting_prtg_sensors(
+            customer_config['prtg_instances']
+        )
 
-    # Get a reference to this customer's PRTG sensor Smartsheet.
-    prtg_smartsheet = SMARTSHEET_CLIENT.Sheets.get_sheet(customer_config['smartsheet_sheet_ids']['prtg_alerts'])
+        # Get the reference to the downloaded Smartsheet.
+        prtg_smartsheet = prtg_smartsheet_future.result()
 
     # Convert the sensors to Smartsheet rows.
     current_alerting_prtg_sensors_rows = convert_prtg_sensors_to_smartsheet_rows(current_alerting_prtg_sensors, prtg_smartsheet)
 
-    # Clear the Smartsheet before pushing the fresh data.
-    clear_smartsheet(prtg_smartsheet)
-
-    # Add all the rows to the Smartsheet.
-    add_rows_to_smartsheet(prtg_smartsheet, current_alerting_prtg_sensors_rows)
+    # Sync the fresh rows into the Smartsheet.
+    sync_smartsheet_rows(prtg_smartsheet, current_alerting_prtg_sensors_rows, PRTG_SMARTSHEET_KEY_COLUMN_INDEXES)
 
 
 def put_customer_data_into_smartsheets(customer_config: dict) -> None:
     """
     Given a customer configuration, get their quarterly Opsgenie alerts,
     quarterly ServiceNow tickets, and the current non-online PRTG sensor data
-    and push it into their own respective Smartsheets.
+    and push it into their own respective Smartsheets. Each data source is
+    handled at the same time since they use independent services and
+    Smartsheets.
 
     Args:
         customer_config (dict): The customer's configuration.
     """
     
-    # Push this customer's Opsgenie alert data into a Smartsheet.
-    put_opsgenie_data_into_smartsheet(customer_config)
+    with ThreadPoolExecutor(max_workers=CUSTOMER_DATA_SOURCE_COUNT) as customer_executor:
+        # Push this customer's Opsgenie alert data into a Smartsheet.
+        opsgenie_future = customer_executor.submit(put_opsgenie_data_into_smartsheet, customer_config)
 
-    # Push this customer's ServiceNow tickets into a Smartsheet.
-    put_servicenow_data_into_smartsheet(customer_config)
+        # Push this customer's ServiceNow tickets into a Smartsheet.
+        servicenow_future = customer_executor.submit(put_servicenow_data_into_smartsheet, customer_config)
 
-    # Push this customer's current PRTG sensor alerts into a Smartsheet.
-    put_prtg_sensor_data_into_smartsheet(customer_config)
+        # Push this customer's current PRTG sensor alerts into a Smartsheet.
+        prtg_future = customer_executor.submit(put_prtg_sensor_data_into_smartsheet, customer_config)
 
+        # Wait for all the data to be pushed, raising any errors that
+        # occurred along the way.
+        for data_source_future in (opsgenie_future, servicenow_future, prtg_future):
+            data_source_future.result()
 
-def main():
+
+@lru_cache(maxsize=1)
+def get_customer_configs() -> list[dict]:
     """
-    Runs the Quarterly Business Report automation!
+    Returns the configurations of all customers from the customer
+    configurations file. The file is only read on the first call.
+
+    Returns:
+        list[dict]: The configurations of all customers.
     """
 
-    logger.info('Beginning QBR automation...')
+    # Read the customer configurations file.
+    with open(CUSTOMER_CONFIGS_FILE_PATH, 'rb') as file:
+        customer_configs_file_json = orjson.loads(file.read())
+
+    # The customer configurations are stored as a JSON string inside the file.
+    customer_configs_string = customer_configs_file_json['data']['customer_configs']
+    return orjson.loads(customer_configs_string)
+
+
+def run_customer_qbr_automation(customer_config: dict) -> bool:
+    """
+    Given a customer configuration, run the QBR automation for that customer.
+    Any error is logged here so that it does not stop the QBR automation for
+    the other customers.
+
+    Args:
+        customer_config (dict): The customer's configuration.
+
+    Returns:
+        bool: True if the QBR automation completed for the customer, False
+            otherwise.
+    """
 
-    # Push all customer alert and ticket data into their respective Smartsheets.
-    for customer_config in CUSTOMER_CONFIGS:
-        logger.info(f'Beginning QBR automation for "{customer_config['customer_name']}"...')
+    logger.info('Beginning QBR automation for "{}"...', customer_config['customer_name'])
 
-        # Push all this customer's new data into their respective Smartsheets.
+    # Push all this customer's new data into their respective Smartsheets.
+    try:
         put_customer_data_into_smartsheets(customer_config)
+    except Exception:
+        logger.exception('QBR automation failed for "{}"', customer_config['customer_name'])
+        return False
+
+    logger.info('Completed QBR automation for "{}"!', customer_config['customer_name'])
+    return True
+
+
+def main():
+    """
+    Runs the Quarterly Business Report automation!
+    """
+
+    # Include the thread name in every log line, since customers and their
+    # data sources are handled concurrently.
+    logger.remove()
+    logger.add(sys.stderr, format=LOG_FORMAT)
+
+    logger.info('Beginning QBR automation...')
 
-        logger.info(f'Completed QBR automation for "{customer_config['customer_name']}"!')
+    # Push all customer alert and ticket data into their respective
+    # Smartsheets. Up to CUSTOMER_MAX_CONCURRENT_RUNS customers are handled at
+    # the same time since every customer has their own Smartsheets.
+    try:
+        # Build the connections and the Smartsheet rate limiter before any
+        # customer thread starts, since every customer must share the same
+        # ones and concurrent first calls could each build their own.
+        get_smartsheet_client()
+        get_smartsheet_rate_limiter()
+        get_opsgenie_client()
+
+        with ThreadPoolExecutor(max_workers=CUSTOMER_MAX_CONCURRENT_RUNS, thread_name_prefix='qbr') as qbr_executor:
+            customer_results = list(qbr_executor.map(run_customer_qbr_automation, get_customer_configs()))
+    finally:
+        # Close the pooled connections shared by every customer.
+        PRTG_SESSION.close()
+        SERVICENOW_CLIENT.close()
+
+    # Check if the QBR automation failed for any customer.
+    failed_customer_count = customer_results.count(False)
+    if failed_customer_count != 0:
+        logger.error(f'QBR automation failed for {failed_customer_count} of '
+                     f'{len(customer_results)} customers!')
+        raise SystemExit(1)
     
     logger.info('QBR automation completed successfully!')
 